@@ -1,10 +1,16 @@
 import streamlit as st
-import pandas as pd
-import geopandas as gpd
-import numpy as np
-import pydeck as pdk
 import streamlit.components.v1 as components
 
+from hazard_common import (
+    HAZARDS,
+    HAZARD_COLOR_MAPS,
+    HAZARD_LEVELS_ORDER,
+    OVERALL_COLOR_MAP,
+    OVERALL_LEVELS_ORDER,
+    make_hazard_deck,
+    prepare_counties,
+)
+
 # -----------------------------
 # CONFIG
 # -----------------------------
@@ -30,193 +36,20 @@ Replace them with real data as needed.
 """
 )
 
-# -----------------------------
-# LOAD KENTUCKY COUNTIES GEO DATA
-# -----------------------------
-@st.cache_data
-def load_counties():
-    # Census TIGER/Line counties for US, then filter Kentucky (STATEFP = '21')
-    url = "https://www2.census.gov/geo/tiger/TIGER2018/COUNTY/tl_2018_us_county.zip"
-    gdf = gpd.read_file(url)
-    ky = gdf[gdf["STATEFP"] == "21"].copy()
-    ky = ky.to_crs(epsg=4326)  # WGS84 lat/lon
-    ky = ky.explode(ignore_index=True)
-    return ky
-
-
-counties = load_counties()
-
-# -----------------------------
-# HAZARD DEFINITIONS
-# -----------------------------
-HAZARDS = [
-    ("Flooding", "flood"),
-    ("Winter Weather", "winter"),
-    ("Wind", "wind"),
-    ("Severe Weather", "severe"),
-    ("Extreme Temperature", "extreme_temp"),
-    ("Other", "other"),
-]
-
-# -----------------------------
-# OVERALL STOPLIGHT SCALE (4 LEVELS)
-# -----------------------------
-def overall_score_to_level(score: float) -> str:
-    if score < 0.25:
-        return "Very Low (White)"
-    elif score < 0.5:
-        return "Low (Green)"
-    elif score < 0.75:
-        return "Elevated (Yellow)"
-    else:
-        return "High (Red)"
-
-
-OVERALL_LEVELS_ORDER = [
-    "Very Low (White)",
-    "Low (Green)",
-    "Elevated (Yellow)",
-    "High (Red)",
-]
-
-OVERALL_COLOR_MAP = {
-    "Very Low (White)": [255, 255, 255],  # White
-    "Low (Green)": [0, 128, 0],           # Green
-    "Elevated (Yellow)": [255, 255, 0],   # Yellow
-    "High (Red)": [255, 0, 0],            # Red
-}
-
-# -----------------------------
-# HAZARD-SPECIFIC LEVELS (3 LEVELS)
-# -----------------------------
-def hazard_score_to_level(score: float) -> str:
-    """3-category scale: Low / Medium / High"""
-    if score < 1/3:
-        return "Low"
-    elif score < 2/3:
-        return "Medium"
-    else:
-        return "High"
-
-
-HAZARD_LEVELS_ORDER = ["Low", "Medium", "High"]
-
-# Color maps for each hazard
-HAZARD_COLOR_MAPS = {
-    # Flooding – three greens
-    "flood": {
-        "Low": [198, 239, 206],    # light green
-        "Medium": [120, 200, 140], # medium green
-        "High": [0, 100, 0],       # dark green
-    },
-    # Winter – three blues
-    "winter": {
-        "Low": [198, 219, 239],    # light blue
-        "Medium": [91, 155, 213],  # medium blue
-        "High": [0, 70, 140],      # dark blue
-    },
-    # Wind – three purples
-    "wind": {
-        "Low": [221, 214, 235],    # light purple
-        "Medium": [165, 105, 189], # medium purple
-        "High": [88, 24, 69],      # dark purple
-    },
-    # Severe Weather – three reds
-    "severe": {
-        "Low": [252, 199, 191],    # light red
-        "Medium": [244, 96, 96],   # medium red
-        "High": [153, 0, 0],       # dark red
-    },
-    # Extreme Temperature – blue (low) to orange (high)
-    "extreme_temp": {
-        "Low": [0, 112, 192],      # blue
-        "Medium": [255, 192, 0],   # yellow-ish
-        "High": [237, 125, 49],    # orange
-    },
-    # Other – grayscale
-    "other": {
-        "Low": [230, 230, 230],    # light gray
-        "Medium": [160, 160, 160], # medium gray
-        "High": [90, 90, 90],      # dark gray
-    },
-}
-
-# -----------------------------
-# RANDOM HAZARD SCORES PER COUNTY
-# -----------------------------
-np.random.seed(42)  # reproducible demo
-
-# Generate hazard-specific scores, levels, colors
-for label, key in HAZARDS:
-    score_col = f"{key}_score"
-    level_col = f"{key}_level"
-    color_col = f"{key}_color"
-
-    counties[score_col] = np.random.rand(len(counties))  # 0–1
-    counties[level_col] = counties[score_col].apply(hazard_score_to_level)
-    counties[color_col] = counties[level_col].map(HAZARD_COLOR_MAPS[key])
-
-# Overall = average of all hazard scores
-score_cols = [f"{key}_score" for _, key in HAZARDS]
-counties["overall_score"] = counties[score_cols].mean(axis=1)
-counties["overall_level"] = counties["overall_score"].apply(overall_score_to_level)
-counties["overall_color"] = counties["overall_level"].map(OVERALL_COLOR_MAP)
-
-# -----------------------------
-# GEOMETRY -> COORDINATES FOR PYDECK
-# -----------------------------
-def geometry_to_coordinates(geom):
-    if geom.geom_type == "Polygon":
-        return [list(geom.exterior.coords)]
-    elif geom.geom_type == "MultiPolygon":
-        return [list(poly.exterior.coords) for poly in geom.geoms]
-    else:
-        return []
-
-
-counties["coordinates"] = counties["geometry"].apply(geometry_to_coordinates)
-
-# Use bounds for map center (no centroid warnings)
-minx, miny, maxx, maxy = counties.total_bounds
-center_lon = (minx + maxx) / 2
-center_lat = (miny + maxy) / 2
+with st.sidebar:
+    st.header("Map Detail")
+    tolerance = st.select_slider(
+        "Boundary simplification (degrees)",
+        options=[0.0, 0.0005, 0.001, 0.0025, 0.005],
+        value=0.001,
+        help="Higher values draw coarser county outlines but load faster. 0 = full detail.",
+    )
 
-view_state = pdk.ViewState(
-    longitude=center_lon,
-    latitude=center_lat,
-    zoom=6,
-    pitch=0,
-)
+counties, center_lon, center_lat = prepare_counties(tolerance)
 
 # -----------------------------
 # HELPERS
 # -----------------------------
-def make_hazard_deck(df, level_col, score_col, color_col, hazard_label):
-    layer = pdk.Layer(
-        "PolygonLayer",
-        data=df,
-        get_polygon="coordinates",
-        get_fill_color=color_col,  # column with [R,G,B]
-        get_line_color=[0, 0, 0],
-        line_width_min_pixels=1,
-        pickable=True,
-        auto_highlight=True,
-    )
-
-    tooltip_html = (
-        "<b>{NAME} County</b><br/>"
-        + f"{hazard_label} level: " + "{" + level_col + "}" + "<br/>"
-        + "Score: " + "{" + score_col + "}"
-    )
-
-    deck = pdk.Deck(
-        layers=[layer],
-        initial_view_state=view_state,
-        tooltip={"html": tooltip_html, "style": {"color": "black"}},
-    )
-    return deck
-
-
 def render_colorbar(title: str, levels_order, level_to_color, height: int = 80):
     """
     Render a simple horizontal colorbar using raw HTML via components.html
@@ -293,7 +126,8 @@ All values are random demo data.
 st.markdown("## Overall Multi-Hazard Threat")
 
 overall_deck = make_hazard_deck(
-    counties, "overall_level", "overall_score", "overall_color", "Overall"
+    counties, "overall_level", "overall_score", "overall_color", "Overall",
+    center_lon, center_lat,
 )
 st.pydeck_chart(overall_deck, width="stretch", height=400)
 
@@ -320,7 +154,8 @@ for row_start in range(0, len(HAZARDS), 2):
         with col:
             st.markdown(f"### {label}")
             hazard_deck = make_hazard_deck(
-                counties, level_col, score_col, color_col, label
+                counties, level_col, score_col, color_col, label,
+                center_lon, center_lat,
             )
             st.pydeck_chart(hazard_deck, width="stretch", height=350)
 
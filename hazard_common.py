@@ -0,0 +1,242 @@
+"""Shared Kentucky county data, hazard scales and pydeck helpers.
+
+Kept out of the page scripts so every Streamlit entry point (or page of a
+multipage app) hits the same cached functions instead of loading and scoring
+the counties independently.
+"""
+import os
+
+import streamlit as st
+import pandas as pd
+import geopandas as gpd
+import numpy as np
+import pydeck as pdk
+import pyogrio
+import shapely
+
+# -----------------------------
+# LOAD KENTUCKY COUNTIES GEO DATA
+# -----------------------------
+# Kentucky-only counties are persisted here after the first download so later
+# cold starts read ~120 rows of GeoParquet instead of the US-wide shapefile.
+COUNTIES_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ky_counties.parquet")
+
+
+@st.cache_data
+def load_counties(tolerance: float = 0.0):
+    """Return (counties, center_lon, center_lat); the center comes from the state bounds.
+
+    ``tolerance`` (degrees) simplifies the boundaries with Douglas-Peucker. The
+    parquet keeps full resolution so each tolerance is derived from it once.
+    """
+    if os.path.exists(COUNTIES_CACHE_PATH):
+        ky = gpd.read_parquet(COUNTIES_CACHE_PATH)
+    else:
+        # Census TIGER/Line counties for US, filtered to Kentucky (STATEFP = '21') by GDAL
+        url = "https://www2.census.gov/geo/tiger/TIGER2018/COUNTY/tl_2018_us_county.zip"
+        ky = pyogrio.read_dataframe(url, where="STATEFP = '21'", use_arrow=True)
+        ky = ky.to_crs(epsg=4326)  # WGS84 lat/lon
+        ky = ky.explode(ignore_index=True)
+        ky.to_parquet(COUNTIES_CACHE_PATH)
+
+    if tolerance > 0:
+        # Far fewer vertices than a zoom-6 overview can show -> smaller deck payload
+        ky["geometry"] = ky.geometry.simplify(tolerance, preserve_topology=True)
+
+    # Use bounds for map center (no centroid warnings), computed once per load
+    minx, miny, maxx, maxy = ky.total_bounds
+    return ky, (minx + maxx) / 2, (miny + maxy) / 2
+
+
+# -----------------------------
+# HAZARD DEFINITIONS
+# -----------------------------
+HAZARDS = [
+    ("Flooding", "flood"),
+    ("Winter Weather", "winter"),
+    ("Wind", "wind"),
+    ("Severe Weather", "severe"),
+    ("Extreme Temperature", "extreme_temp"),
+    ("Other", "other"),
+]
+
+# -----------------------------
+# OVERALL STOPLIGHT SCALE (4 LEVELS)
+# -----------------------------
+OVERALL_LEVELS_ORDER = [
+    "Very Low (White)",
+    "Low (Green)",
+    "Elevated (Yellow)",
+    "High (Red)",
+]
+
+# Score cut points: < 0.25 / < 0.5 / < 0.75 / >= 0.75 (np.digitize buckets)
+OVERALL_BINS = np.array([0.25, 0.5, 0.75])
+
+OVERALL_COLOR_MAP = {
+    "Very Low (White)": [255, 255, 255],  # White
+    "Low (Green)": [0, 128, 0],           # Green
+    "Elevated (Yellow)": [255, 255, 0],   # Yellow
+    "High (Red)": [255, 0, 0],            # Red
+}
+
+# Same colors as OVERALL_COLOR_MAP, one row per bucket (OVERALL_LEVELS_ORDER)
+OVERALL_COLOR_LUT = np.array(
+    [OVERALL_COLOR_MAP[level] for level in OVERALL_LEVELS_ORDER], dtype=np.uint8
+)
+
+# -----------------------------
+# HAZARD-SPECIFIC LEVELS (3 LEVELS)
+# -----------------------------
+HAZARD_LEVELS_ORDER = ["Low", "Medium", "High"]
+
+# 3-category scale: < 1/3 Low, < 2/3 Medium, otherwise High
+HAZARD_BINS = np.array([1/3, 2/3])
+
+# Color maps for each hazard
+HAZARD_COLOR_MAPS = {
+    # Flooding – three greens
+    "flood": {
+        "Low": [198, 239, 206],    # light green
+        "Medium": [120, 200, 140], # medium green
+        "High": [0, 100, 0],       # dark green
+    },
+    # Winter – three blues
+    "winter": {
+        "Low": [198, 219, 239],    # light blue
+        "Medium": [91, 155, 213],  # medium blue
+        "High": [0, 70, 140],      # dark blue
+    },
+    # Wind – three purples
+    "wind": {
+        "Low": [221, 214, 235],    # light purple
+        "Medium": [165, 105, 189], # medium purple
+        "High": [88, 24, 69],      # dark purple
+    },
+    # Severe Weather – three reds
+    "severe": {
+        "Low": [252, 199, 191],    # light red
+        "Medium": [244, 96, 96],   # medium red
+        "High": [153, 0, 0],       # dark red
+    },
+    # Extreme Temperature – blue (low) to orange (high)
+    "extreme_temp": {
+        "Low": [0, 112, 192],      # blue
+        "Medium": [255, 192, 0],   # yellow-ish
+        "High": [237, 125, 49],    # orange
+    },
+    # Other – grayscale
+    "other": {
+        "Low": [230, 230, 230],    # light gray
+        "Medium": [160, 160, 160], # medium gray
+        "High": [90, 90, 90],      # dark gray
+    },
+}
+
+# Lookup tables indexed by digitize bucket (HAZARD_LEVELS_ORDER)
+HAZARD_COLOR_LUTS = {
+    key: np.array([cmap[level] for level in HAZARD_LEVELS_ORDER], dtype=np.uint8)
+    for key, cmap in HAZARD_COLOR_MAPS.items()
+}
+
+# -----------------------------
+# RANDOM HAZARD SCORES PER COUNTY
+# -----------------------------
+def assign_levels(scores, bins, levels_order):
+    """Bucket 1-D scores with np.digitize.
+
+    Returns (buckets, levels): the integer buckets index the color LUTs and are
+    reused as the codes of an ordered Categorical over ``levels_order``.
+    """
+    buckets = np.digitize(scores, bins)
+    levels = pd.Categorical.from_codes(buckets, categories=levels_order, ordered=True)
+    return buckets, levels
+
+
+@st.cache_resource
+def prepare_counties(tolerance: float):
+    """Counties with demo scores, levels, colors and pydeck coordinates attached.
+
+    Cached as a shared resource so widget reruns reuse the same prepared frame
+    (treat it as read-only) instead of rescoring and re-extracting coordinates,
+    and so decks built from it can be cached on its identity.
+    """
+    counties, center_lon, center_lat = load_counties(tolerance)
+
+    rng = np.random.default_rng(42)  # reproducible demo
+
+    # One (N, n_hazards) block of 0–1 scores, added to the frame in a single concat
+    scores = rng.random((len(counties), len(HAZARDS)))
+    score_df = pd.DataFrame(
+        scores, columns=[f"{key}_score" for _, key in HAZARDS], index=counties.index
+    )
+    counties = pd.concat([counties, score_df], axis=1)
+
+    # Levels and colors per hazard from digitize buckets
+    for i, (label, key) in enumerate(HAZARDS):
+        buckets, levels = assign_levels(scores[:, i], HAZARD_BINS, HAZARD_LEVELS_ORDER)
+        counties[f"{key}_level"] = levels
+        counties[f"{key}_color"] = HAZARD_COLOR_LUTS[key][buckets].tolist()
+
+    # Overall = average of all hazard scores
+    overall_scores = scores.mean(axis=1)
+    counties["overall_score"] = overall_scores
+    overall_buckets, overall_levels = assign_levels(
+        overall_scores, OVERALL_BINS, OVERALL_LEVELS_ORDER
+    )
+    counties["overall_level"] = overall_levels
+    counties["overall_color"] = OVERALL_COLOR_LUT[overall_buckets].tolist()
+
+    # Geometry -> coordinates for pydeck. `explode` leaves only Polygons, so each
+    # row is a single exterior ring; pull all ring vertices out in one shapely
+    # call and split them back per polygon.
+    rings = shapely.get_exterior_ring(counties.geometry.values)
+    coords, ring_index = shapely.get_coordinates(rings, return_index=True)
+    coords = coords.round(5)  # ~1 m; trims the JSON sent to the browser
+    splits = np.flatnonzero(np.diff(ring_index)) + 1
+    counties["coordinates"] = [[ring.tolist()] for ring in np.split(coords, splits)]
+
+    return counties, center_lon, center_lat
+
+
+# -----------------------------
+# HELPERS
+# -----------------------------
+# Decks are keyed on the identity of the cached counties frame plus the scalar
+# args, so reruns reuse the assembled layer and serialized polygon data.
+@st.cache_resource(hash_funcs={gpd.GeoDataFrame: id, pd.DataFrame: id})
+def make_hazard_deck(df, level_col, score_col, color_col, hazard_label, center_lon, center_lat):
+    # Ship only what this layer draws or shows in its tooltip. Passing the full
+    # GeoDataFrame makes pydeck serialize every hazard's columns plus a GeoJSON
+    # copy of each geometry alongside "coordinates".
+    layer_data = pd.DataFrame(df[["NAME", level_col, score_col, color_col, "coordinates"]])
+    layer = pdk.Layer(
+        "PolygonLayer",
+        data=layer_data,
+        get_polygon="coordinates",
+        get_fill_color=color_col,  # column with [R,G,B]
+        get_line_color=[0, 0, 0],
+        line_width_min_pixels=1,
+        pickable=True,
+        auto_highlight=True,
+    )
+
+    tooltip_html = (
+        "<b>{NAME} County</b><br/>"
+        + f"{hazard_label} level: " + "{" + level_col + "}" + "<br/>"
+        + "Score: " + "{" + score_col + "}"
+    )
+
+    view_state = pdk.ViewState(
+        longitude=center_lon,
+        latitude=center_lat,
+        zoom=6,
+        pitch=0,
+    )
+
+    deck = pdk.Deck(
+        layers=[layer],
+        initial_view_state=view_state,
+        tooltip={"html": tooltip_html, "style": {"color": "black"}},
+    )
+    return deck